@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 import json
+import os
 import re
 import requests
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 COMBINED = Path("combined.json")
 MASTER = Path("stadiums_master.json")
@@ -12,6 +15,15 @@ FBS = Path("fbs_stadiums.json")
 GEOCODER = "https://nominatim.openstreetmap.org/search"
 HEADERS = {"User-Agent": "fbf-stadium-geocoder/1.0 (forgedbyfreedom.org)"}
 
+# One keep-alive connection for the whole geocoding pass; transient 5xx
+# from Nominatim retry with backoff instead of losing the venue.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(
+    max_retries=Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=(502, 503, 504)),
+))
+
 
 def load_json(path, default=None):
     try:
@@ -22,16 +34,24 @@ def load_json(path, default=None):
 
 
 def save_json(path, obj):
-    with open(path, "w", encoding="utf-8") as f:
+    # temp-file + os.replace so readers never see a truncated file
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
         json.dump(obj, f, indent=2)
+    os.replace(tmp, path)
+
+
+# compiled once instead of hitting the re cache twice per venue
+_NON_ALNUM = re.compile(r"[^a-z0-9 ]+")
+_WS = re.compile(r"\s+")
 
 
 def normalize(name: str) -> str:
     if not name:
         return ""
     n = name.lower().strip()
-    n = re.sub(r"[^a-z0-9 ]+", "", n)
-    n = re.sub(r"\s+", " ", n)
+    n = _NON_ALNUM.sub("", n)
+    n = _WS.sub(" ", n)
     return n
 
 
@@ -43,7 +63,7 @@ def geocode(city: str, state: str):
     try:
         q = f"{city}, {state}, USA"
         params = {"q": q, "format": "json", "limit": 1}
-        r = requests.get(GEOCODER, params=params, headers=HEADERS, timeout=10)
+        r = SESSION.get(GEOCODER, params=params, timeout=10)
         if r.status_code == 200:
             arr = r.json()
             if arr:
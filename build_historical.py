@@ -127,14 +127,15 @@ def main():
         }
 
     out = {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": now_utc.isoformat(),
         "source": INPUT,
         "games_used": finished_games,
         "teams": teams_out,
     }
 
-    with open(OUTPUT, "w") as f:
+    with open(OUTPUT + ".tmp", "w") as f:
         json.dump(out, f, indent=2)
+    os.replace(OUTPUT + ".tmp", OUTPUT)
 
     print(
         f"✅ Wrote {OUTPUT} (teams={len(teams_out)}, historical_games={finished_games})"
@@ -245,7 +245,7 @@ def fetch_events_for_season(sport_key: str, season_year: int) -> List[Dict[str,
     return out
 
 def main():
-    now = dt.datetime.utcnow()
+    now = dt.datetime.now(dt.timezone.utc)
     end_year = now.year
     start_year = end_year - 4  # 5 seasons inclusive
 
@@ -265,8 +265,9 @@ def main():
         "data": all_rows
     }
 
-    with open(OUTFILE, "w") as f:
+    with open(OUTFILE + ".tmp", "w") as f:
         json.dump(payload, f, indent=2)
+    os.replace(OUTFILE + ".tmp", OUTFILE)
 
     print(f"[✅] Wrote {OUTFILE} with {len(all_rows)} games.")
 
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import json
+import os
 from pathlib import Path
 from predictions_model import predict
 
@@ -56,8 +57,9 @@ def main():
 
     output["count"] = len(output["predictions"])
 
-    with open(OUTFILE, "w") as f:
+    with open(f"{OUTFILE}.tmp", "w") as f:
         json.dump(output, f, indent=2)
+    os.replace(f"{OUTFILE}.tmp", OUTFILE)
 
     print(f"[✅] Predictions generated for {output['count']} games.]")
 
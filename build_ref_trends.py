@@ -79,8 +79,9 @@ def main():
         "refs": refs,
     }
 
-    with open(OUTPUT, "w") as f:
+    with open(OUTPUT + ".tmp", "w") as f:
         json.dump(out, f, indent=2)
+    os.replace(OUTPUT + ".tmp", OUTPUT)
 
     print(f"✅ Wrote {OUTPUT} (refs={len(refs)})")
 
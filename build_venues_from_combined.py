@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import json
+import os
 import re
 from pathlib import Path
 
@@ -16,13 +17,23 @@ def load_json(path, default=None):
         return default
 
 
+# compiled once; games repeat the same handful of venue names, so the
+# per-name memo makes the per-game path a pure dict lookup
+_NON_ALNUM = re.compile(r"[^a-z0-9 ]+")
+_WS = re.compile(r"\s+")
+_norm_cache = {}
+
+
 def normalize(name):
     if not name:
         return ""
-    n = name.lower().strip()
-    n = re.sub(r"[^a-z0-9 ]+", "", n)
-    n = re.sub(r"\s+", " ", n)
-    return n
+    cached = _norm_cache.get(name)
+    if cached is None:
+        n = name.lower().strip()
+        n = _NON_ALNUM.sub("", n)
+        n = _WS.sub(" ", n)
+        _norm_cache[name] = cached = n
+    return cached
 
 
 def find_match(venue, master):
@@ -62,8 +73,9 @@ def main():
         if "lon" in match and venue.get("lon") is None:
             venue["lon"] = match["lon"]
 
-    with open(OUTFILE, "w") as f:
+    with open(f"{OUTFILE}.tmp", "w") as f:
         json.dump(combined, f, indent=2)
+    os.replace(f"{OUTFILE}.tmp", OUTFILE)
 
     print(f"📌 Updated combined.json with coordinates for {updated} venues.")
 
@@ -10,14 +10,85 @@ Hardened version:
 - Guarantees combined.json is populated (no more empty output)
 """
 
+import gzip
+import hashlib
 import json, os, requests, time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from pathlib import Path
+from sys import intern
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# FBF_PURE_PYTHON=1 forces the stdlib-only code path (e.g. under PyPy,
+# where the tracing JIT handles the dict-walk hot loops and the C
+# extensions are unavailable or slower than the JIT'd fallback).
+PURE_PYTHON = os.environ.get("FBF_PURE_PYTHON", "").lower() in ("1", "true", "yes")
+
+orjson = None
+simdjson = None
+if not PURE_PYTHON:
+    try:
+        import orjson  # ~3x faster parse, ~10x faster dump than stdlib json
+    except ImportError:  # runner without requirements installed
+        orjson = None
+    try:
+        import simdjson  # lazy SIMD parser for index pages (pysimdjson)
+    except ImportError:
+        simdjson = None
+
+_TLS = threading.local()
+
+
+def get_parser():
+    """simdjson.Parser is not thread-safe; keep one per worker thread."""
+    if simdjson is None:
+        return None
+    parser = getattr(_TLS, "parser", None)
+    if parser is None:
+        parser = _TLS.parser = simdjson.Parser()
+    return parser
+
 TIMEOUT = 12
 RETRIES = 4
 BACKOFF = 0.6
 
+# Short-TTL on-disk response cache: a re-run (or crash-retry) inside the
+# window skips the whole HTTP round-trip. ESPN_CACHE_TTL=0 disables it.
+CACHE_DIR = Path(".espn_cache")
+CACHE_TTL = float(os.environ.get("ESPN_CACHE_TTL", "90"))
+
+# One pooled session for every ESPN call: keep-alive skips the TCP+TLS
+# handshake on the hundreds of $ref resolutions per run.
+SESSION = requests.Session()
+# urllib3-level retries recover transient 429/5xx in-run (honoring
+# Retry-After) instead of dropping a whole league until the next cron.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET",),
+    respect_retry_after_header=True,
+)
+SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8,
+                                      max_retries=_RETRY))
+SESSION.headers.update({
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/131.0 Safari/537.36"
+    ),
+    "Accept": "application/json",
+    # explicit so every hop negotiates compression; requests decompresses
+    # transparently before .content
+    "Accept-Encoding": "gzip, deflate",
+})
+
 NY_TZ = ZoneInfo("America/New_York")
 
 # ESPN league endpoints
@@ -42,22 +113,94 @@ OFFICIALS_CACHE = {}
 # ------------------------------------------------------------
 #  HARDENED FETCH WITH RETRIES + REAL BROWSER HEADERS
 # ------------------------------------------------------------
-def get_json(url):
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/131.0 Safari/537.36"
-        ),
-        "Accept": "application/json",
-        "Connection": "close",
-    }
+def _parse_bytes(buf):
+    if orjson is not None:
+        # parse raw bytes directly; skips requests' text decode
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def _cache_path(url):
+    return CACHE_DIR / (hashlib.sha1(url.encode()).hexdigest() + ".json")
+
+
+def _cache_read(url):
+    if CACHE_TTL <= 0:
+        return None
+    p = _cache_path(url)
+    try:
+        if time.time() - p.stat().st_mtime < CACHE_TTL:
+            return p.read_bytes()
+    except OSError:
+        pass
+    return None
+
+
+def _cache_stale(url):
+    """Expired cached body + validators, for conditional revalidation."""
+    if CACHE_TTL <= 0:
+        return None, {}
+    p = _cache_path(url)
+    try:
+        body = p.read_bytes()
+    except OSError:
+        return None, {}
+    cond = {}
+    try:
+        meta = json.loads(Path(str(p) + ".meta").read_bytes())
+        if meta.get("etag"):
+            cond["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            cond["If-Modified-Since"] = meta["last_modified"]
+    except (OSError, ValueError):
+        pass
+    return body, cond
+
+
+def _cache_write(url, content, headers=None):
+    if CACHE_TTL <= 0:
+        return
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        p = _cache_path(url)
+        tmp = str(p) + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(content)
+        os.replace(tmp, p)
+        if headers is not None:
+            etag = headers.get("ETag")
+            lastmod = headers.get("Last-Modified")
+            if etag or lastmod:
+                meta = {"etag": etag, "last_modified": lastmod}
+                with open(str(p) + ".meta", "w") as f:
+                    json.dump(meta, f)
+    except OSError:
+        pass
+
+
+def get_json(url, raw=False):
+    cached = _cache_read(url)
+    if cached is not None:
+        return cached if raw else _parse_bytes(cached)
+
+    # expired copy + validators -> conditional GET; a 304 has no body to
+    # download or parse, we just re-arm the TTL on the cached bytes
+    stale, cond = _cache_stale(url)
 
     for attempt in range(RETRIES):
         try:
-            r = requests.get(url, timeout=TIMEOUT, headers=headers)
+            r = SESSION.get(url, timeout=TIMEOUT, headers=cond or None)
+            if r.status_code == 304 and stale is not None:
+                try:
+                    os.utime(_cache_path(url))
+                except OSError:
+                    pass
+                return stale if raw else _parse_bytes(stale)
             r.raise_for_status()
-            return r.json()
+            _cache_write(url, r.content, r.headers)
+            if raw:
+                return r.content
+            return _parse_bytes(r.content)
         except Exception as ex:
             print(f"[WARN] GET failed ({attempt+1}/{RETRIES}): {url}")
             if attempt < RETRIES - 1:
@@ -67,6 +210,29 @@ def get_json(url):
                 return None
 
 
+def get_item_refs(url):
+    """Fetch an ESPN index page and return just items[*].$ref.
+
+    Index pages carry paging metadata we never touch; with pysimdjson the
+    buffer is scanned lazily and only the ref strings are materialized.
+    """
+    parser = get_parser()
+    if parser is not None:
+        buf = get_json(url, raw=True)
+        if not buf:
+            return []
+        try:
+            doc = parser.parse(buf)
+            return [str(it["$ref"]) for it in doc["items"] if "$ref" in it]
+        except (KeyError, TypeError, ValueError):
+            return []
+
+    idx = get_json(url)
+    if not idx:
+        return []
+    return [it["$ref"] for it in idx.get("items") or [] if it.get("$ref")]
+
+
 def iso_to_local_date(iso_str):
     try:
         dt = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
@@ -82,14 +248,32 @@ def yyyymmdd(d):
 # ------------------------------------------------------------
 #  WHITELIST CALENDAR HANDLING
 # ------------------------------------------------------------
-def get_next_7_whitelist_dates(league_path, today_local):
-    wl = get_json(f"{BASE}/{league_path}/calendar/whitelist")
+def get_whitelist_iso_dates(league_path):
+    """Project just eventDate.dates out of the calendar payload.
+
+    The whitelist response carries season/week subtrees we never read;
+    the lazy path skips materializing them entirely.
+    """
+    url = f"{BASE}/{league_path}/calendar/whitelist"
+    parser = get_parser()
+    if parser is not None:
+        buf = get_json(url, raw=True)
+        if not buf:
+            return []
+        try:
+            return [str(s) for s in parser.parse(buf)["eventDate"]["dates"]]
+        except (KeyError, TypeError, ValueError):
+            return []
+
+    wl = get_json(url)
     if not wl:
         return []
+    return wl.get("eventDate", {}).get("dates") or []
 
-    dates = wl.get("eventDate", {}).get("dates") or []
+
+def get_next_7_whitelist_dates(league_path, today_local):
     out = []
-    for iso_str in dates:
+    for iso_str in get_whitelist_iso_dates(league_path):
         d = iso_to_local_date(iso_str)
         if d and d >= today_local:
             out.append(d)
@@ -124,26 +308,22 @@ def resolve_odds(ref):
     if ref in ODDS_CACHE:
         return ODDS_CACHE[ref]
 
-    idx = get_json(ref)
-    if not idx:
-        ODDS_CACHE[ref] = None
-        return None
-
+    # Single-pass scan tracking the best provider priority seen so far;
+    # priority 1 short-circuits immediately (it is usually the first item).
     best = None
-    for it in idx.get("items") or []:
-        oref = it.get("$ref")
-        if not oref:
-            continue
+    best_pri = None
+    for oref in get_item_refs(ref):
         o = get_json(oref)
         if not o:
             continue
 
-        prov = (o.get("provider") or {})
-        if prov.get("priority") == 1:
+        pri = (o.get("provider") or {}).get("priority")
+        if pri == 1:
             best = o
             break
-        if best is None:
+        if best is None or (isinstance(pri, int) and (best_pri is None or pri < best_pri)):
             best = o
+            best_pri = pri if isinstance(pri, int) else None
 
     ODDS_CACHE[ref] = best
     return best
@@ -166,8 +346,13 @@ def resolve_officials(ref):
     for o in items:
         if isinstance(o, dict) and "$ref" in o:
             o = get_json(o["$ref"]) or o
-        person = o.get("person") or {}
-        name = person.get("fullName") or o.get("fullName")
+        try:
+            name = o["person"]["fullName"]
+        except (KeyError, TypeError):
+            name = None
+        # a present-but-null person.fullName must still fall back
+        if not name:
+            name = o.get("fullName")
         role = o.get("position") or o.get("role")
         if name:
             out.append({"name": name, "role": role})
@@ -179,6 +364,12 @@ def resolve_officials(ref):
 # ------------------------------------------------------------
 #  EVENT EXTRACTION
 # ------------------------------------------------------------
+def intern_str(s):
+    """Intern repeated JSON strings (team names, abbrs, sport keys) so the
+    thousands of record dicts share one copy per distinct value."""
+    return intern(s) if type(s) is str else s
+
+
 def extract_competition(ev):
     comps = ev.get("competitions") or []
     return comps[0] if comps else None
@@ -187,8 +378,21 @@ def extract_competition(ev):
 def extract_scores_and_teams(comp):
     competitors = comp.get("competitors") or []
 
-    home = next((c for c in competitors if c.get("homeAway") == "home"), None)
-    away = next((c for c in competitors if c.get("homeAway") == "away"), None)
+    # One walk instead of two next() scans over the same list.
+    # Well-formed competitors always carry homeAway, so subscript + except
+    # beats a .get() call per entry.
+    home = away = None
+    for c in competitors:
+        try:
+            side = c["homeAway"]
+        except (KeyError, TypeError):
+            continue
+        if side == "home":
+            home = c
+        elif side == "away":
+            away = c
+        if home is not None and away is not None:
+            break
 
     def team_blob(c):
         if not c:
@@ -198,11 +402,11 @@ def extract_scores_and_teams(comp):
         if not t:
             return None
         return {
-            "id": t.get("id"),
-            "name": t.get("displayName") or t.get("name"),
-            "abbr": t.get("abbreviation"),
-            "slug": t.get("slug"),
-            "logo": (t.get("logos") or [{}])[0].get("href"),
+            "id": intern_str(t.get("id")),
+            "name": intern_str(t.get("displayName") or t.get("name")),
+            "abbr": intern_str(t.get("abbreviation")),
+            "slug": intern_str(t.get("slug")),
+            "logo": intern_str((t.get("logos") or [{}])[0].get("href")),
         }
 
     def score_val(c):
@@ -235,7 +439,7 @@ def extract_odds_from_comp(comp):
         "details": o.get("details"),
         "spread": o.get("spread"),
         "total": o.get("overUnder"),
-        "provider": (o.get("provider") or {}).get("name"),
+        "provider": intern_str((o.get("provider") or {}).get("name")),
     }
 
 
@@ -247,9 +451,9 @@ def extract_venue_from_comp(comp):
 
     addr = v.get("address") or {}
     return {
-        "name": v.get("fullName"),
-        "city": addr.get("city"),
-        "state": addr.get("state"),
+        "name": intern_str(v.get("fullName")),
+        "city": intern_str(addr.get("city")),
+        "state": intern_str(addr.get("state")),
         "indoor": v.get("indoor"),
         "grass": v.get("grass"),
     }
@@ -258,6 +462,57 @@ def extract_venue_from_comp(comp):
 # ------------------------------------------------------------
 #  GAME RECORD BUILDER
 # ------------------------------------------------------------
+@dataclass(slots=True)
+class GameRecord:
+    """One game row of combined.json.
+
+    Slots cut per-record memory ~3x versus a 14-key dict; orjson
+    serializes dataclasses natively so the JSON output is unchanged.
+    """
+    sport: str
+    id: str
+    name: str
+    shortName: str
+    date_utc: str
+    date_local: str
+    home_team: dict
+    away_team: dict
+    home_score: float
+    away_score: float
+    total_points: float
+    odds: dict
+    venue: dict
+    officials: list
+
+
+_GAME_FIELDS = tuple(f.name for f in fields(GameRecord))
+
+
+def record_as_dict(rec):
+    # stdlib-json fallback shim; orjson handles dataclasses directly
+    return {k: getattr(rec, k) for k in _GAME_FIELDS}
+
+
+_DATE_LOCAL_CACHE = {}
+
+
+def format_local_date(dt_utc):
+    """ISO UTC string -> 'YYYY-MM-DD HH:MM AM ET', memoized.
+
+    Many games share the same kickoff slot, so after the first few events
+    the parse+astimezone+strftime work collapses to one dict lookup.
+    """
+    cached = _DATE_LOCAL_CACHE.get(dt_utc)
+    if cached is not None:
+        return cached
+    try:
+        dt = datetime.fromisoformat(dt_utc.replace("Z", "+00:00"))
+        out = dt.astimezone(NY_TZ).strftime("%Y-%m-%d %I:%M %p ET")
+    except:
+        out = dt_utc
+    return _DATE_LOCAL_CACHE.setdefault(dt_utc, out)
+
+
 def build_game_record(sport_key, ev):
     comp = extract_competition(ev)
     if not comp:
@@ -271,59 +526,50 @@ def build_game_record(sport_key, ev):
     venue = extract_venue_from_comp(comp)
     officials = resolve_officials((comp.get("officials") or {}).get("$ref"))
 
-    # time
-    dt_utc = ev.get("date")
-    try:
-        dt = datetime.fromisoformat(dt_utc.replace("Z", "+00:00"))
-        local = dt.astimezone(NY_TZ)
-        dt_local = local.strftime("%Y-%m-%d %I:%M %p ET")
-    except:
-        dt_local = dt_utc
-
-    return {
-        "sport": sport_key,
-        "id": ev.get("id"),
-        "name": ev.get("name"),
-        "shortName": ev.get("shortName"),
-        "date_utc": dt_utc,
-        "date_local": dt_local,
-
-        "home_team": home_team,
-        "away_team": away_team,
-        "home_score": home_score,
-        "away_score": away_score,
-        "total_points": (home_score or 0) + (away_score or 0),
-
-        "odds": odds,
-        "venue": venue,
-        "officials": officials,
-    }
+    # time (normalized to "" so sort keys never see None)
+    dt_utc = ev.get("date") or ""
+    dt_local = format_local_date(dt_utc)
+
+    return GameRecord(
+        sport=intern_str(sport_key),
+        id=ev.get("id"),
+        name=ev.get("name"),
+        shortName=ev.get("shortName"),
+        date_utc=dt_utc,
+        date_local=dt_local,
+
+        home_team=home_team,
+        away_team=away_team,
+        home_score=home_score,
+        away_score=away_score,
+        total_points=(home_score or 0) + (away_score or 0),
+
+        odds=odds,
+        venue=venue,
+        officials=officials,
+    )
 
 
 # ------------------------------------------------------------
 #  EVENT FETCHERS
 # ------------------------------------------------------------
 def events_for_date(path, d):
-    idx = get_json(f"{BASE}/{path}/events?dates={yyyymmdd(d)}&lang=en&region=us")
-    if not idx:
-        return []
+    refs = get_item_refs(f"{BASE}/{path}/events?dates={yyyymmdd(d)}&lang=en&region=us")
     out = []
-    for it in idx.get("items") or []:
-        ev = get_json(it.get("$ref"))
+    for ref in refs:
+        ev = get_json(ref)
         if ev:
             out.append(ev)
     return out
 
 
 def events_for_range(path, start, end):
-    idx = get_json(
+    refs = get_item_refs(
         f"{BASE}/{path}/events?dates={yyyymmdd(start)}-{yyyymmdd(end)}&lang=en&region=us"
     )
-    if not idx:
-        return []
     out = []
-    for it in idx.get("items") or []:
-        ev = get_json(it.get("$ref"))
+    for ref in refs:
+        ev = get_json(ref)
         if ev:
             out.append(ev)
     return out
@@ -332,55 +578,113 @@ def events_for_range(path, start, end):
 # ------------------------------------------------------------
 #  MAIN
 # ------------------------------------------------------------
-def write_latest_file(key, data):
+# Pretty output is ~25% more bytes and slower to serialize; nothing human
+# reads these files before the dashboard does. Opt back in with FBF_PRETTY_JSON=1.
+PRETTY_JSON = os.environ.get("FBF_PRETTY_JSON", "").lower() in ("1", "true", "yes")
+
+# JSON full of repeated keys/team names compresses ~6-10x; level 1 keeps
+# the CPU cost negligible. Enable with FBF_GZIP_OUTPUT=1 once downstream
+# consumers accept .json.gz.
+GZIP_OUTPUT = os.environ.get("FBF_GZIP_OUTPUT", "").lower() in ("1", "true", "yes")
+
+
+def write_json_file(fn, payload, gzip_copy=False):
+    if orjson is not None:
+        opt = orjson.OPT_INDENT_2 if PRETTY_JSON else 0
+        buf = orjson.dumps(payload, option=opt)
+    else:
+        buf = json.dumps(payload, indent=2 if PRETTY_JSON else None,
+                         separators=None if PRETTY_JSON else (",", ":"),
+                         default=record_as_dict).encode("utf-8")
+    # temp-file + os.replace so readers never see a truncated file
+    tmp = fn + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(buf)
+    os.replace(tmp, fn)
+    if gzip_copy and GZIP_OUTPUT:
+        with gzip.open(fn + ".gz", "wb", compresslevel=1) as f:
+            f.write(buf)
+
+
+def write_ndjson_file(fn, records):
+    # One record per line so downstream single-pass consumers can stream
+    # rows with orjson.loads(line) instead of materializing the whole
+    # combined.json list in memory.
+    tmp = fn + ".tmp"
+    with open(tmp, "wb") as f:
+        if orjson is not None:
+            for rec in records:
+                f.write(orjson.dumps(rec))
+                f.write(b"\n")
+        else:
+            for rec in records:
+                f.write(json.dumps(rec, separators=(",", ":"),
+                                   default=record_as_dict).encode("utf-8"))
+                f.write(b"\n")
+    os.replace(tmp, fn)
+
+
+def write_latest_file(key, data, ts):
     fn = f"{key}_latest.json"
     payload = {
-        "timestamp": datetime.now(timezone.utc).strftime("%Y%m%d_%H%M"),
+        "timestamp": ts,
         "count": len(data),
         "data": data,
     }
-    with open(fn, "w") as f:
-        json.dump(payload, f, indent=2)
+    write_json_file(fn, payload)
     print(f"✅ Wrote {fn} ({len(data)} games)")
     return fn
 
 
-def main():
-    today_local = datetime.now(NY_TZ).date()
-    combined = []
+def fetch_league(key, path, today_local):
+    # whitelist dates preferred
+    wl = get_next_7_whitelist_dates(path, today_local)
 
-    for key, path in LEAGUES.items():
-        # whitelist dates preferred
-        wl = get_next_7_whitelist_dates(path, today_local)
+    evs = []
+    if wl:
+        for d in wl:
+            evs.extend(events_for_date(path, d))
+    else:
+        end_d = today_local + timedelta(days=6)
+        evs.extend(events_for_range(path, today_local, end_d))
 
-        evs = []
-        if wl:
-            for d in wl:
-                evs.extend(events_for_date(path, d))
-        else:
-            end_d = today_local + timedelta(days=6)
-            evs.extend(events_for_range(path, today_local, end_d))
+    games = []
+    for ev in evs:
+        rec = build_game_record(key, ev)
+        if rec:
+            games.append(rec)
 
-        games = []
-        for ev in evs:
-            rec = build_game_record(key, ev)
-            if rec:
-                games.append(rec)
+    games.sort(key=attrgetter("date_utc"))
+    return games
+
+
+def main():
+    today_local = datetime.now(NY_TZ).date()
+    # one timestamp for the whole batch; every output file shares it
+    ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M")
+    combined = []
 
-        games.sort(key=lambda g: g["date_utc"] or "")
-        write_latest_file(key, games)
+    # Leagues are independent and I/O-bound, so fetch them concurrently;
+    # wall time collapses to roughly the slowest league instead of the sum.
+    with ThreadPoolExecutor(max_workers=len(LEAGUES)) as ex:
+        futures = {key: ex.submit(fetch_league, key, path, today_local)
+                   for key, path in LEAGUES.items()}
 
-        combined.extend(games)
+        # write in LEAGUES order so logs/outputs stay deterministic
+        for key, fut in futures.items():
+            games = fut.result()
+            write_latest_file(key, games, ts)
+            combined.extend(games)
 
-    combined.sort(key=lambda g: g["date_utc"] or "")
+    combined.sort(key=attrgetter("date_utc"))
     combined_payload = {
-        "timestamp": datetime.now(timezone.utc).strftime("%Y%m%d_%H%M"),
+        "timestamp": ts,
         "count": len(combined),
         "data": combined,
     }
 
-    with open("combined.json", "w") as f:
-        json.dump(combined_payload, f, indent=2)
+    write_json_file("combined.json", combined_payload, gzip_copy=True)
+    write_ndjson_file("combined.ndjson", combined)
 
     print(f"✅ Wrote combined.json ({len(combined)} games)")
 
@@ -1,13 +1,27 @@
 #!/usr/bin/env python3
 import requests
 import json
-import time
+import os
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 OUTFILE = "injuries.json"
 
+# shared keep-alive pool for the concurrent feed fetches; transient
+# 429/5xx retry with backoff instead of dropping a sport
+SESSION = requests.Session()
+SESSION.headers.update({"Accept-Encoding": "gzip, deflate"})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=(429, 500, 502, 503, 504)),
+))
+
 def fetch_json(url):
     try:
-        r = requests.get(url, timeout=10)
+        r = SESSION.get(url, timeout=10)
         if r.status_code == 200:
             return r.json()
     except:
@@ -23,10 +37,14 @@ def fetch_espn_injuries():
         ("basketball", "ncb")
     ]
 
+    # the four sport feeds are independent, so fetch them concurrently;
+    # results are collected in sports order to keep output deterministic
+    urls = [f"{base}/{cat}/{lg}/news/injuries" for cat, lg in sports]
+    with ThreadPoolExecutor(max_workers=len(urls)) as ex:
+        payloads = list(ex.map(fetch_json, urls))
+
     injuries = []
-    for cat, lg in sports:
-        url = f"{base}/{cat}/{lg}/news/injuries"
-        data = fetch_json(url)
+    for data in payloads:
         if not data or "injuries" not in data:
             continue
         for team in data["injuries"]:
@@ -77,8 +95,9 @@ def main():
             print("⚠️ Rotowire failed, falling back to empty injury list")
             final = []
 
-    with open(OUTFILE, "w") as f:
+    with open(OUTFILE + ".tmp", "w") as f:
         json.dump(final, f, indent=2)
+    os.replace(OUTFILE + ".tmp", OUTFILE)
 
     print(f"✅ Wrote {OUTFILE} ({len(final)} injuries)")
 
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 import json
+from functools import lru_cache
+import os
+import re
 import time
 from typing import List, Dict
 import requests
@@ -17,17 +20,18 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; ForgedByFreedomBot/1.0)"
 }
 
+# Precompiled once instead of rebuilding these literals for every DOM node
+TEAM_HINTS = ("Crimson Tide", "State", "Tigers", "Bulldogs")
+STATUS_TOKENS = ("Out", "Questionable", "Probable", "OFS")
+
+# one C pass via translate instead of five full-string replaces; keep
+# this in sync with the copy in merge_injuries.py so index keys line up
+_STRIP = str.maketrans("", "", "().,'")
+_WS = re.compile(r"\s+")
+
+@lru_cache(maxsize=2048)
 def normalize_team(name: str) -> str:
-    return (
-        name.lower()
-        .replace("(", "")
-        .replace(")", "")
-        .replace(".", "")
-        .replace(",", "")
-        .replace("'", "")
-        .replace("  ", " ")
-        .strip()
-    )
+    return _WS.sub(" ", name.lower().translate(_STRIP)).strip()
 
 def fetch_page(url: str) -> BeautifulSoup:
     resp = requests.get(url, headers=HEADERS, timeout=15)
@@ -62,7 +66,7 @@ def parse_injuries_for_sport(sport: str, url: str) -> List[Dict]:
             continue
 
         # Team headers look like "#10 Alabama Crimson Tide" or "Alabama Crimson Tide"
-        if "Crimson Tide" in text or "State" in text or "Tigers" in text or "Bulldogs" in text:
+        if any(hint in text for hint in TEAM_HINTS):
             # Heuristic: treat any line that starts with "#" or has a ranked team-style phrase as a header
             if "DATE" in text or "EST. RETURN" in text:
                 continue
@@ -81,7 +85,7 @@ def parse_injuries_for_sport(sport: str, url: str) -> List[Dict]:
         # Injury lines look like:
         # "CJ Allen (LB) Out Not Specified Undisclosed Dec 13, 2025"
         if current_team and "(" in text and ")" in text and any(
-            status in text for status in ["Out", "Questionable", "Probable", "OFS"]
+            status in text for status in STATUS_TOKENS
         ):
             raw = text
             try:
@@ -143,8 +147,9 @@ def main():
         "injuries": all_rows,
     }
 
-    with open("injuries.json", "w") as f:
+    with open("injuries.json.tmp", "w") as f:
         json.dump(payload, f, indent=2)
+    os.replace("injuries.json.tmp", "injuries.json")
 
     print(f"[injuries] wrote injuries.json with {len(all_rows)} total injuries")
 
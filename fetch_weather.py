@@ -1,45 +1,137 @@
 #!/usr/bin/env python3
+import asyncio
 import json
-import os
+import socket
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
 import requests
 
+try:
+    import aiohttp  # async NWS fetching; sync requests loop is the fallback
+except ImportError:
+    aiohttp = None
+
+try:
+    import simdjson  # lazy projection of periods[0] from the ~20KB body
+except ImportError:
+    simdjson = None
+
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from weather_common import load_json, make_key, orjson, parse_wind_mph, save_json
+
 COMBINED_FILE = "combined.json"
 OUTFILE = "weather_raw.json"
 
-HEADERS = {"User-Agent": "fbf-weather-fetcher/1.0 (forgedbyfreedom.org)"}
+# Ask for geo+json explicitly and compressed transfer: the repetitive
+# forecast JSON gzips ~70%, and requests/aiohttp decompress for free.
+HEADERS = {
+    "User-Agent": "fbf-weather-fetcher/1.0 (forgedbyfreedom.org)",
+    "Accept": "application/geo+json",
+    "Accept-Encoding": "gzip, deflate",
+}
 GEOCODER = "https://nominatim.openstreetmap.org/search"
 
-US_STATES = {
+# Pooled session for the sync paths (geocoder + requests fallback):
+# keep-alive skips per-call TCP+TLS setup, urllib3 retries transient
+# 429/5xx with backoff.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=1.2,
+                      status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=("GET",)),
+))
+
+# NWS fair-use allows modest parallelism; 8 in-flight requests collapses
+# the two-hop-per-venue wall time to roughly N/8 round-trips.
+CONCURRENCY = 8
+
+US_STATES = frozenset({
     "AL","AK","AZ","AR","CA","CO","CT","DE","FL","GA","HI","ID","IL","IN","IA","KS",
     "KY","LA","ME","MD","MA","MI","MN","MS","MO","MT","NE","NV","NH","NJ","NM","NY",
     "NC","ND","OH","OK","OR","PA","RI","SC","SD","TN","TX","UT","VT","VA","WA","WV",
     "WI","WY"
-}
+})
 
 
-def load_json(path):
-    if not os.path.exists(path):
-        return None
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+def parse_body(resp):
+    """Decode a response body with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
 
+def is_us_outdoor(venue):
+    return (isinstance(venue, dict)
+            and not venue.get("indoor")
+            and venue.get("state") in US_STATES)
 
-def save_json(path, obj):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2)
 
+# Stadium -> NWS grid assignments are effectively static, so the
+# points/{lat,lon} hop is cached on disk across runs (the Actions bot
+# commits it like every other artifact). Keyed by rounded coordinates.
+POINTS_CACHE_FILE = "nws_points_cache.json"
+_points_cache = {}
 
-def is_us_outdoor(venue):
-    if not isinstance(venue, dict):
-        return False
-    indoor = bool(venue.get("indoor", False))
-    state = venue.get("state")
-    if indoor:
-        return False
-    if not state or state not in US_STATES:
-        return False
-    return True
+
+def load_points_cache():
+    cached = load_json(POINTS_CACHE_FILE)
+    if isinstance(cached, dict):
+        _points_cache.update(cached)
+
+
+def save_points_cache():
+    if _points_cache:
+        save_json(POINTS_CACHE_FILE, _points_cache)
+
+
+# Hourly forecasts regenerate on NWS's schedule, not ours: validators let
+# a 304 skip the body transfer and parse. We keep the small extracted
+# weather dict per forecast URL, not the raw payload.
+ETAG_CACHE_FILE = "nws_etag_cache.json"
+_etag_cache = {}
+
+
+def load_etag_cache():
+    cached = load_json(ETAG_CACHE_FILE)
+    if isinstance(cached, dict):
+        _etag_cache.update(cached)
+
+
+def save_etag_cache():
+    if _etag_cache:
+        save_json(ETAG_CACHE_FILE, _etag_cache)
+
+
+def etag_lookup(url):
+    """Conditional headers + previously extracted weather for a URL."""
+    rec = _etag_cache.get(url)
+    if not isinstance(rec, dict):
+        return {}, None
+    cond = {}
+    if rec.get("etag"):
+        cond["If-None-Match"] = rec["etag"]
+    if rec.get("last_modified"):
+        cond["If-Modified-Since"] = rec["last_modified"]
+    return cond, rec.get("weather")
+
+
+def etag_store(url, headers, weather):
+    etag = headers.get("ETag")
+    lastmod = headers.get("Last-Modified")
+    if etag or lastmod:
+        _etag_cache[url] = {
+            "etag": etag,
+            "last_modified": lastmod,
+            "weather": weather,
+        }
 
 
 _geo_cache = {}
@@ -57,9 +149,9 @@ def geocode(city, state):
     try:
         q = f"{city}, {state}, USA"
         params = {"q": q, "format": "json", "limit": 1}
-        r = requests.get(GEOCODER, params=params, headers=HEADERS, timeout=10)
+        r = SESSION.get(GEOCODER, params=params, timeout=10)
         if r.status_code == 200:
-            arr = r.json()
+            arr = parse_body(r)
             if arr:
                 lat = float(arr[0]["lat"])
                 lon = float(arr[0]["lon"])
@@ -75,55 +167,118 @@ def geocode(city, state):
 
 
 def fetch_point(lat, lon):
+    key = make_key(lat, lon)
+    cached = _points_cache.get(key)
+    if cached:
+        return cached
+
     url = f"https://api.weather.gov/points/{lat},{lon}"
     try:
-        r = requests.get(url, headers=HEADERS, timeout=10)
+        r = SESSION.get(url, timeout=10)
         if r.status_code == 404:
             return None
         r.raise_for_status()
-        data = r.json()
-        return data["properties"]["forecastHourly"]
+        data = parse_body(r)
+        point_url = data["properties"]["forecastHourly"]
+        _points_cache[key] = point_url
+        return point_url
     except Exception:
         return None
 
 
-def fetch_hourly(url):
+def fetch_hourly_weather(url):
+    """Hourly forecast -> extracted weather dict, revalidating via 304."""
+    cond, cached_wx = etag_lookup(url)
     try:
-        r = requests.get(url, headers=HEADERS, timeout=10)
+        r = SESSION.get(url, headers=cond or None, timeout=10)
+        if r.status_code == 304 and cached_wx is not None:
+            return cached_wx
         r.raise_for_status()
-        return r.json()
+        wx = extract_weather_bytes(r.content)
     except Exception:
         return None
+    if wx:
+        etag_store(url, r.headers, wx)
+    return wx
+
 
+_TLS = threading.local()
 
-def parse_wind_mph(raw_wind):
-    """NOAA windSpeed is often '10 mph'. Convert to numeric mph when possible."""
-    if raw_wind is None:
+
+def get_parser():
+    """simdjson.Parser is not thread-safe; keep one per worker thread."""
+    if simdjson is None:
         return None
-    if isinstance(raw_wind, (int, float)):
-        return float(raw_wind)
-    if isinstance(raw_wind, str):
-        parts = raw_wind.split()
-        for p in parts:
-            try:
-                return float(p)
-            except ValueError:
-                continue
-    return None
+    parser = getattr(_TLS, "parser", None)
+    if parser is None:
+        parser = _TLS.parser = simdjson.Parser()
+    return parser
 
 
-def main():
-    combined = load_json(COMBINED_FILE)
-    if not combined or "data" not in combined:
-        print("❌ combined.json missing or invalid")
-        return
+# one C-level projection instead of four .get calls; NWS periods always
+# carry these keys, so the KeyError fallback is the rare path
+_PERIOD_FIELDS = itemgetter(
+    "temperature", "windSpeed", "shortForecast", "detailedForecast")
 
-    games = combined["data"]
-    print(f"🔎 Fetching weather for {len(games)} games...")
 
-    weather_map = {}
-    processed = 0
+def _period_to_weather(p0):
+    try:
+        temp, wind_raw, short, detailed = _PERIOD_FIELDS(p0)
+    except KeyError:
+        temp = p0.get("temperature")
+        wind_raw = p0.get("windSpeed")
+        short = p0.get("shortForecast")
+        detailed = p0.get("detailedForecast")
+    return {
+        "temperatureF": temp,
+        "windSpeedMph": parse_wind_mph(wind_raw),
+        "shortForecast": short,
+        "detailedForecast": detailed,
+    }
+
+
+def extract_weather(hourly):
+    """First hourly period -> normalized weather dict, or None."""
+    if not hourly or "properties" not in hourly:
+        return None
+
+    periods = hourly["properties"].get("periods") or []
+    if not periods:
+        return None
+
+    return _period_to_weather(periods[0])
+
+
+def extract_weather_bytes(buf):
+    """Raw hourly body -> weather dict.
+
+    We only read periods[0], so simdjson's lazy parse materializes a
+    single period instead of the full 24h list; orjson/stdlib full
+    parse is the fallback.
+    """
+    parser = get_parser()
+    if parser is not None:
+        try:
+            p0 = parser.parse(buf)["properties"]["periods"][0].as_dict()
+        except (KeyError, IndexError, TypeError, ValueError):
+            return None
+        return _period_to_weather(p0)
+    # mirror the simdjson branch: a malformed 200 body degrades to None
+    # instead of escaping through asyncio.gather and killing the run
+    try:
+        hourly = orjson.loads(buf) if orjson is not None else json.loads(buf)
+    except ValueError:
+        return None
+    return extract_weather(hourly)
+
+
+def collect_targets(games):
+    """Filter to US outdoor games with coordinates -> [(gid, lat, lon)].
 
+    Geocoding stays synchronous here: Nominatim asks for 1 req/s, and the
+    in-memory cache makes repeats free.
+    """
+    targets = []
     for g in games:
         if not isinstance(g, dict):
             continue
@@ -142,43 +297,191 @@ def main():
         lon = venue.get("lon")
 
         if lat is None or lon is None:
-            city = venue.get("city")
-            state = venue.get("state")
-            lat, lon = geocode(city, state)
+            lat, lon = geocode(venue.get("city"), venue.get("state"))
 
         if lat is None or lon is None:
             # No usable coordinates
             continue
 
-        point_url = fetch_point(lat, lon)
-        if not point_url:
-            continue
+        targets.append((str(gid), lat, lon))
+    return targets
+
+
+def dedupe_targets(targets):
+    """Collapse games sharing a venue to one fetch per unique coordinate.
+
+    Returns (coord_targets, members): one (key, lat, lon) per distinct
+    venue, plus key -> [game ids] to fan results back out.
+    """
+    coords = {}
+    members = {}
+    for gid, lat, lon in targets:
+        k = make_key(lat, lon)
+        if k not in coords:
+            coords[k] = (k, lat, lon)
+        members.setdefault(k, []).append(gid)
+    return list(coords.values()), members
+
+
+# mirror the urllib3 Retry policy the sync session gets
+_RETRY_STATUS = (429, 500, 502, 503, 504)
+
+
+async def get_async(session, url, headers=None, tries=3):
+    """GET with exponential backoff on transient NWS errors.
+
+    Returns (status, headers, body); honors Retry-After on 429 so burst
+    5xx/throttle responses stop dropping venues for the whole run.
+    """
+    delay = 0.5
+    for attempt in range(tries):
+        try:
+            async with session.get(url, headers=headers) as r:
+                if r.status in _RETRY_STATUS and attempt < tries - 1:
+                    retry_after = r.headers.get("Retry-After")
+                    wait = (float(retry_after)
+                            if retry_after and retry_after.isdigit()
+                            else delay)
+                    await asyncio.sleep(wait)
+                    delay *= 2
+                    continue
+                body = b"" if r.status == 304 else await r.read()
+                return r.status, r.headers, body
+        except aiohttp.ClientError:
+            if attempt == tries - 1:
+                raise
+            await asyncio.sleep(delay)
+            delay *= 2
+    raise aiohttp.ClientError(f"retries exhausted for {url}")
+
+
+async def resolve_point_url(session, sem, key, lat, lon):
+    """Coordinate key -> forecastHourly URL, via cache or /points/."""
+    point_url = _points_cache.get(key)
+    if point_url:
+        return key, point_url
+    try:
+        async with sem:
+            url = f"https://api.weather.gov/points/{lat},{lon}"
+            status, _, body = await get_async(session, url)
+        if status != 200:
+            return key, None
+        data = orjson.loads(body) if orjson is not None else json.loads(body)
+        point_url = data["properties"]["forecastHourly"]
+        _points_cache[key] = point_url
+        return key, point_url
+    except Exception:
+        return key, None
 
-        hourly = fetch_hourly(point_url)
-        if not hourly or "properties" not in hourly:
-            continue
 
-        periods = hourly["properties"].get("periods") or []
-        if not periods:
-            continue
+async def fetch_hourly_async(session, sem, url):
+    """forecastHourly URL -> normalized weather dict, revalidating via 304."""
+    cond, cached_wx = etag_lookup(url)
+    try:
+        async with sem:
+            status, resp_headers, buf = await get_async(
+                session, url, headers=cond or None)
+        if status == 304 and cached_wx is not None:
+            return url, cached_wx
+        if status != 200:
+            return url, None
+    except Exception:
+        return url, None
+
+    wx = extract_weather_bytes(buf)
+    if wx:
+        etag_store(url, resp_headers, wx)
+    return url, wx
+
+
+async def fetch_all_async(targets):
+    sem = asyncio.Semaphore(CONCURRENCY)
+    # IPv4-only avoids the try-IPv6-then-fall-back stall some NWS POPs
+    # show, scoped to this connector instead of any global resolver hack
+    connector = aiohttp.TCPConnector(
+        family=socket.AF_INET,
+        limit=CONCURRENCY,
+        ttl_dns_cache=600,
+        use_dns_cache=True,
+    )
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=timeout, headers=HEADERS
+    ) as session:
+        # Phase 1: coordinate -> forecastHourly URL. Nearby stadiums land
+        # in the same NWS grid cell and share a URL, so group before the
+        # heavier hourly fetch and hit each unique URL exactly once.
+        resolved = await asyncio.gather(
+            *[resolve_point_url(session, sem, key, lat, lon)
+              for key, lat, lon in targets]
+        )
+        by_url = {}
+        for key, point_url in resolved:
+            if point_url:
+                by_url.setdefault(point_url, []).append(key)
+
+        # Phase 2: one hourly fetch per unique grid URL, fanned back out.
+        fetched = await asyncio.gather(
+            *[fetch_hourly_async(session, sem, url) for url in by_url]
+        )
+    out = {}
+    for url, wx in fetched:
+        if wx:
+            for key in by_url[url]:
+                out[key] = wx
+    return out
+
+
+def _fetch_one_sync(target):
+    gid, lat, lon = target
+    point_url = fetch_point(lat, lon)
+    if not point_url:
+        return gid, None
+    return gid, fetch_hourly_weather(point_url)
+
+
+def fetch_all_sync(targets):
+    """Threaded requests fallback when aiohttp is unavailable.
+
+    The session's urllib3 pool is thread-safe, so CONCURRENCY workers
+    share the same keep-alive sockets and match the async path's
+    parallelism instead of paying N*2 serial round-trips.
+    """
+    weather_map = {}
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as ex:
+        for gid, wx in ex.map(_fetch_one_sync, targets):
+            if wx:
+                weather_map[gid] = wx
+    return weather_map
 
-        props = periods[0]
-        temp = props.get("temperature")
-        wind_raw = props.get("windSpeed")
-        wind_mph = parse_wind_mph(wind_raw)
-        short = props.get("shortForecast")
-        detailed = props.get("detailedForecast")
-
-        weather_map[str(gid)] = {
-            "temperatureF": temp,
-            "windSpeedMph": wind_mph,
-            "shortForecast": short,
-            "detailedForecast": detailed,
-        }
-        processed += 1
 
+def main():
+    combined = load_json(COMBINED_FILE)
+    if not combined or "data" not in combined:
+        print("❌ combined.json missing or invalid")
+        return
+
+    games = combined["data"]
+    print(f"🔎 Fetching weather for {len(games)} games...")
+
+    load_points_cache()
+    load_etag_cache()
+    coord_targets, members = dedupe_targets(collect_targets(games))
+    if aiohttp is not None:
+        by_coord = asyncio.run(fetch_all_async(coord_targets))
+    else:
+        by_coord = fetch_all_sync(coord_targets)
+
+    # fan the per-venue result back out to every game at that venue
+    weather_map = {}
+    for k, wx in by_coord.items():
+        for gid in members.get(k, ()):
+            weather_map[gid] = wx
+
+    save_points_cache()
+    save_etag_cache()
     save_json(OUTFILE, {"data": weather_map})
-    print(f"✅ Weather written: {processed} locations → {OUTFILE}")
+    print(f"✅ Weather written: {len(weather_map)} locations → {OUTFILE}")
 
 
 if __name__ == "__main__":
@@ -5,37 +5,49 @@ gpu_backend.py
 Optional GPU/CPU abstraction.
 - If cupy is installed and a CUDA device is available, uses GPU arrays.
 - Otherwise falls back to numpy.
+
+The probe is lazy: importing cupy initializes a CUDA context (hundreds
+of ms), so detection runs on first use of the backend, not at import.
 """
 
 from __future__ import annotations
 import os
 
-BACKEND = "numpy"
-xp = None
-
-def _try_cupy():
-    global BACKEND, xp
-    try:
-        import cupy  # type: ignore
-        # basic device test
-        _ = cupy.zeros((1,))
-        xp = cupy
-        BACKEND = "cupy"
-        return True
-    except Exception:
-        return False
-
-def _use_numpy():
-    global BACKEND, xp
+BACKEND = None  # resolved on first use
+_xp = None
+
+
+def _init():
+    global BACKEND, _xp
+    if _xp is not None:
+        return _xp
+    if os.environ.get("FBF_FORCE_CPU", "").lower() not in ("1", "true", "yes"):
+        try:
+            import cupy  # type: ignore
+            _ = cupy.zeros((1,))  # basic device test
+            BACKEND = "cupy"
+            _xp = cupy
+            return _xp
+        except Exception:
+            pass
     import numpy
-    xp = numpy
     BACKEND = "numpy"
+    _xp = numpy
+    return _xp
+
+
+def get_xp():
+    """The array module (cupy or numpy), probing on first call."""
+    return _init()
 
-if os.environ.get("FBF_FORCE_CPU", "").lower() in ("1","true","yes"):
-    _use_numpy()
-else:
-    if not _try_cupy():
-        _use_numpy()
 
 def backend_name() -> str:
+    _init()
     return BACKEND
+
+
+def __getattr__(name):
+    # keep `from gpu_backend import xp` working, initializing lazily
+    if name == "xp":
+        return _init()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import json
+import os
 import asyncio
 from playwright.async_api import async_playwright
 
@@ -11,50 +12,81 @@ SPORTS = {
     "nhl": "https://www.oddstrader.com/nhl/injuries/",
 }
 
-async def scrape_injuries(playwright):
-    browser = await playwright.chromium.launch(headless=True)
-    page = await browser.new_page()
-
-    all_injuries = []
+_BLOCKED_RESOURCES = {"image", "font", "media", "stylesheet"}
 
-    for sport, url in SPORTS.items():
+async def scrape_sport(browser, sem, sport, url):
+    """Scrape one sport in its own context so page loads overlap."""
+    injuries = []
+    async with sem:
         print(f"\n🔍 Fetching {sport.upper()} injuries from Oddstrader…")
-
+        context = await browser.new_context()
+        # the table is all we need; skipping images/fonts/media cuts
+        # most of the page weight on this ad-heavy site
+        await context.route(
+            "**/*",
+            lambda route: (route.abort()
+                           if route.request.resource_type in _BLOCKED_RESOURCES
+                           else route.continue_()),
+        )
+        page = await context.new_page()
         try:
-            await page.goto(url, timeout=60000)
+            # don't wait for the full load event — the selector wait
+            # below resolves as soon as the injury table renders
+            await page.goto(url, timeout=60000, wait_until="domcontentloaded")
             await page.wait_for_selector("table", timeout=60000)
 
-            # Extract rows dynamically rendered by JS
-            rows = await page.query_selector_all("table tbody tr")
+            # One evaluate pulls every JS-rendered row in a single CDP
+            # round-trip instead of N rows x 4 cells of inner_text awaits
+            rows = await page.evaluate(
+                """() => Array.from(
+                       document.querySelectorAll('table tbody tr')
+                   ).map(r => Array.from(
+                       r.querySelectorAll('td'), td => td.innerText))"""
+            )
 
             if not rows:
                 print(f"⚠️ No injury rows found for {sport}")
-                continue
+                return injuries
 
-            for r in rows:
-                cells = await r.query_selector_all("td")
+            for cells in rows:
                 if len(cells) < 4:
                     continue
 
-                player = (await cells[0].inner_text()).strip()
-                team = (await cells[1].inner_text()).strip()
-                status = (await cells[2].inner_text()).strip()
-                detail = (await cells[3].inner_text()).strip()
-
-                all_injuries.append({
+                injuries.append({
                     "sport": sport,
-                    "player": player,
-                    "team": team,
-                    "status": status,
-                    "detail": detail,
+                    "player": cells[0].strip(),
+                    "team": cells[1].strip(),
+                    "status": cells[2].strip(),
+                    "detail": cells[3].strip(),
                 })
 
             print(f"✅ Found {len(rows)} rows for {sport}")
 
         except Exception as e:
             print(f"❌ Error scraping {sport}: {e}")
+        finally:
+            await context.close()
+
+    return injuries
+
+
+async def scrape_injuries(playwright):
+    browser = await playwright.chromium.launch(headless=True)
+
+    # Contexts are cheap and isolated, so the slow JS-rendered page
+    # loads overlap; the semaphore keeps Chromium's memory in check.
+    sem = asyncio.Semaphore(4)
+    results = await asyncio.gather(
+        *[scrape_sport(browser, sem, sport, url)
+          for sport, url in SPORTS.items()]
+    )
 
     await browser.close()
+
+    # gather preserves SPORTS order, so output stays deterministic
+    all_injuries = []
+    for injuries in results:
+        all_injuries.extend(injuries)
     return all_injuries
 
 
@@ -64,8 +96,9 @@ async def main():
 
         print(f"\n📦 Total injuries scraped: {len(injuries)}")
 
-        with open("injuries.json", "w") as f:
+        with open("injuries.json.tmp", "w") as f:
             json.dump({"injuries": injuries}, f, indent=2)
+        os.replace("injuries.json.tmp", "injuries.json")
 
         print("\n🎉 Saved injuries.json")
 
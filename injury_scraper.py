@@ -19,16 +19,20 @@ Shape:
 }
 
 Requirements:
-  pip install requests beautifulsoup4 lxml
+  pip install requests lxml
 """
 
 import json
+import os
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 TIMEOUT = 15
 OUTPUT = "injuries.json"
@@ -45,17 +49,48 @@ LEAGUE_PAGES = {
     "ncaaw": "https://www.espn.com/womens-college-basketball/injuries",
 }
 
+# ESPN injury pages are ~500KB of HTML that gzips ~8-10x; requests
+# decompresses transparently
 HEADERS = {
-    "User-Agent": "fbf-data-bot/1.0 (+https://forgedbyfreedom.org)"
+    "User-Agent": "fbf-data-bot/1.0 (+https://forgedbyfreedom.org)",
+    "Accept-Encoding": "gzip, deflate",
 }
 
+# one keep-alive connection for all seven league pages; transient 5xx
+# and 429 retry with backoff instead of dropping a league
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=(429, 500, 502, 503, 504)),
+))
+
 def get_html(url):
-    r = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
+    r = SESSION.get(url, timeout=TIMEOUT)
     r.raise_for_status()
     return r.text
 
+# hoisted out of clean_text, which runs for every th/td on every page
+_WS_RE = re.compile(r"\s+")
+
 def clean_text(x):
-    return re.sub(r"\s+", " ", (x or "").strip())
+    s = (x or "").strip()
+    # most cells have no internal whitespace runs; skip the regex then
+    if "  " in s or "\t" in s or "\n" in s:
+        return _WS_RE.sub(" ", s)
+    return s
+
+# Compiled XPath runs as C traversal; one document-order pass gets the
+# header/table interleaving without Python-level DOM walks per node.
+_NODES_XPATH = etree.XPath("//h1|//h2|//h3|//table")
+_TH_XPATH = etree.XPath(".//th")
+_TR_XPATH = etree.XPath(".//tr")
+_TD_XPATH = etree.XPath(".//td")
+_BLOCKS_XPATH = etree.XPath("//section|//article|//div")
+_BLOCK_HEADER_XPATH = etree.XPath(".//h2|.//h3")
+_TABLES_XPATH = etree.XPath(".//table")
 
 def parse_injury_page(league_key, html):
     """
@@ -65,31 +100,28 @@ def parse_injury_page(league_key, html):
       - Detect team headers (h2/h3) preceding each table.
       - Parse rows by column labels where possible, else by position.
     """
-    soup = BeautifulSoup(html, "lxml")
+    doc = lxml_html.fromstring(html)
     injuries = []
 
     # ESPN uses a repeating pattern of team-name headers + tables
     # We walk through the DOM in order and track current team.
     current_team = None
 
-    # All relevant blocks are usually in <section> or <article>
-    body = soup.body or soup
-    nodes = body.find_all(["h1", "h2", "h3", "table"], recursive=True)
-
-    for node in nodes:
-        if node.name in ("h2", "h3"):
-            txt = clean_text(node.get_text())
+    for node in _NODES_XPATH(doc):
+        tag = node.tag
+        if tag in ("h2", "h3"):
+            txt = clean_text(node.text_content())
             # Team headers are usually plain like "Chicago Bears"
             if txt and len(txt) < 50 and "injuries" not in txt.lower():
                 current_team = txt
 
-        if node.name == "table":
+        if tag == "table":
             # Parse header columns
-            headers = [clean_text(th.get_text()).lower() for th in node.find_all("th")]
-            rows = node.find_all("tr")
+            headers = [clean_text(th.text_content()).lower() for th in _TH_XPATH(node)]
+            rows = _TR_XPATH(node)
 
             for tr in rows[1:]:
-                cols = [clean_text(td.get_text()) for td in tr.find_all("td")]
+                cols = [clean_text(td.text_content()) for td in _TD_XPATH(tr)]
                 if not cols or len(cols) < 2:
                     continue
 
@@ -141,20 +173,19 @@ def parse_injury_page(league_key, html):
     # If ESPN changed structure so headers didn't capture,
     # try a backup scan for team blocks.
     if not injuries:
-        for team_block in soup.select("section, article, div"):
+        for team_block in _BLOCKS_XPATH(doc):
             team_name = None
-            h = team_block.find(["h2", "h3"])
+            h = _BLOCK_HEADER_XPATH(team_block)
             if h:
-                htxt = clean_text(h.get_text())
+                htxt = clean_text(h[0].text_content())
                 if htxt and len(htxt) < 50:
                     team_name = htxt
 
-            tables = team_block.find_all("table")
-            for t in tables:
-                headers = [clean_text(th.get_text()).lower() for th in t.find_all("th")]
-                rows = t.find_all("tr")
+            for t in _TABLES_XPATH(team_block):
+                headers = [clean_text(th.text_content()).lower() for th in _TH_XPATH(t)]
+                rows = _TR_XPATH(t)
                 for tr in rows[1:]:
-                    cols = [clean_text(td.get_text()) for td in tr.find_all("td")]
+                    cols = [clean_text(td.text_content()) for td in _TD_XPATH(tr)]
                     if not cols or len(cols) < 2:
                         continue
                     rec = {
@@ -171,19 +202,28 @@ def parse_injury_page(league_key, html):
 
     return injuries
 
+def scrape_league(league_key, url):
+    html = get_html(url)
+    return parse_injury_page(league_key, html)
+
 def main():
     leagues_out = {}
-    for league_key, url in LEAGUE_PAGES.items():
-        try:
-            print(f"[⏱️] Scraping {league_key.upper()} injuries...")
-            html = get_html(url)
-            injuries = parse_injury_page(league_key, html)
-            leagues_out[league_key] = injuries
-            print(f"[✅] {league_key.upper()} injuries: {len(injuries)} records")
-            time.sleep(0.7)  # polite delay
-        except Exception as e:
-            print(f"[⚠️] Failed {league_key}: {e}")
-            leagues_out[league_key] = []
+    # Pages are independent, so fetch+parse them concurrently; a few
+    # workers keeps espn.com to a handful of simultaneous hits, which
+    # replaces the old per-page politeness sleep.
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futures = {key: ex.submit(scrape_league, key, url)
+                   for key, url in LEAGUE_PAGES.items()}
+
+        # collect in LEAGUE_PAGES order so logs/output stay deterministic
+        for league_key, fut in futures.items():
+            try:
+                injuries = fut.result()
+                leagues_out[league_key] = injuries
+                print(f"[✅] {league_key.upper()} injuries: {len(injuries)} records")
+            except Exception as e:
+                print(f"[⚠️] Failed {league_key}: {e}")
+                leagues_out[league_key] = []
 
     payload = {
         "timestamp": datetime.now(timezone.utc).strftime("%Y%m%d_%H%M"),
@@ -192,8 +232,9 @@ def main():
         "notes": "ESPN Core API removed injuries endpoints in 2024–2025; scraped from public ESPN injuries pages."
     }
 
-    with open(OUTPUT, "w", encoding="utf-8") as f:
+    with open(OUTPUT + ".tmp", "w", encoding="utf-8") as f:
         json.dump(payload, f, indent=2, ensure_ascii=False)
+    os.replace(OUTPUT + ".tmp", OUTPUT)
 
     total = sum(len(v) for v in leagues_out.values())
     print(f"[🏁] Wrote {OUTPUT} with {total} injuries total.")
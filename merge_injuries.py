@@ -1,24 +1,47 @@
 #!/usr/bin/env python3
 import json
+from functools import lru_cache
+import re
+import os
 
+try:
+    import orjson  # C-speed parse/serialize; stdlib json is the fallback
+except ImportError:
+    orjson = None
+
+
+def load_json(path):
+    with open(path, "rb") as f:
+        buf = f.read()
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def save_json(path, obj):
+    # atomic: serialize to bytes, write a temp file, then os.replace
+    if orjson is not None:
+        buf = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        buf = json.dumps(obj, indent=2).encode("utf-8")
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(buf)
+    os.replace(tmp, path)
+
+
+# one C pass via translate instead of five full-string replaces; keep
+# this in sync with the copy in fetch_injuries_oddstrader.py so index keys line up
+_STRIP = str.maketrans("", "", "().,'")
+_WS = re.compile(r"\s+")
+
+@lru_cache(maxsize=2048)
 def normalize_team(name: str) -> str:
-    return (
-        name.lower()
-        .replace("(", "")
-        .replace(")", "")
-        .replace(".", "")
-        .replace(",", "")
-        .replace("'", "")
-        .replace("  ", " ")
-        .strip()
-    )
+    return _WS.sub(" ", name.lower().translate(_STRIP)).strip()
 
 def main():
-    with open("combined.json") as f:
-        combined = json.load(f)
-
-    with open("injuries.json") as f:
-        inj = json.load(f)
+    combined = load_json("combined.json")
+    inj = load_json("injuries.json")
 
     games = combined.get("data") or combined.get("games") or []
     inj_rows = inj.get("injuries", [])
@@ -56,8 +79,7 @@ def main():
 
     combined["data"] = games
 
-    with open("combined.json", "w") as f:
-        json.dump(combined, f, indent=2)
+    save_json("combined.json", combined)
 
     print(f"[✅] Merged injuries onto {merged_count}/{len(games)} games.")
 
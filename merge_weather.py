@@ -1,26 +1,14 @@
 #!/usr/bin/env python3
-import json
-import os
 from pathlib import Path
 import datetime
 
+from weather_common import load_json, save_json
+
 COMBINED_FILE = Path("combined.json")
 WEATHER_FILE = Path("weather.json")
 OUT_FILE = Path("weather_merged.json")
 
 
-def load_json(path):
-    if not path.exists():
-        return None
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def save_json(path, obj):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2)
-
-
 def main():
     combined = load_json(COMBINED_FILE)
     weather = load_json(WEATHER_FILE)
@@ -64,7 +52,7 @@ def main():
         g["weatherRisk"] = {"risk": risk_val}
         attached += 1
 
-    combined["weather_merged_at"] = datetime.datetime.utcnow().isoformat()
+    combined["weather_merged_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
 
     # Write merged snapshot AND overwrite combined.json so frontend sees it
     save_json(OUT_FILE, combined)
@@ -16,9 +16,13 @@ This is a conservative fallback:
 
 import json
 import os
+import re
 from datetime import datetime, timezone
 import math
 
+# compiled once; parses "Team -7.5" style odds details
+SPREAD_DETAILS_RE = re.compile(r"([+-]?\d+(\.\d+)?)")
+
 COMBINED = "combined.json"
 HISTORICAL = "historical.json"
 REF_TRENDS = "ref_trends.json"
@@ -31,8 +35,6 @@ def safe_float(x, default=None):
         return default
 
 def load_json_or_empty(path, default):
-    if not os.path.exists(path):
-        return default
     try:
         with open(path, "r") as f:
             return json.load(f)
@@ -146,8 +148,7 @@ def main():
         # Parse details like "Team -7.5" if present and spread missing/ambiguous
         details = odds.get("details")
         if spread is None and isinstance(details, str):
-            import re
-            m = re.search(r"([+-]?\d+(\.\d+)?)", details)
+            m = SPREAD_DETAILS_RE.search(details)
             if m:
                 spread = safe_float(m.group(1))
 
@@ -207,8 +208,9 @@ def main():
         "data": preds,
     }
 
-    with open(PRED_OUTPUT, "w") as f:
+    with open(PRED_OUTPUT + ".tmp", "w") as f:
         json.dump(out, f, indent=2)
+    os.replace(PRED_OUTPUT + ".tmp", PRED_OUTPUT)
 
     print(f"✅ Wrote {PRED_OUTPUT} with {len(preds)} fallback predictions")
 
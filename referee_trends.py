@@ -30,8 +30,9 @@ def main():
             "data": [],
             "note": "historical_results.json not found yet — trends will populate once labeled results exist."
         }
-        with open(OUTFILE, "w", encoding="utf-8") as f:
+        with open(OUTFILE + ".tmp", "w", encoding="utf-8") as f:
             json.dump(payload, f, indent=2)
+        os.replace(OUTFILE + ".tmp", OUTFILE)
         print(f"⚠️  {HIST_FILE} missing. Wrote empty {OUTFILE}.")
         return
 
@@ -40,8 +41,9 @@ def main():
 
     if not hist:
         payload = {"timestamp": utc_ts(), "count": 0, "data": [], "note": "no historical rows"}
-        with open(OUTFILE, "w", encoding="utf-8") as f:
+        with open(OUTFILE + ".tmp", "w", encoding="utf-8") as f:
             json.dump(payload, f, indent=2)
+        os.replace(OUTFILE + ".tmp", OUTFILE)
         print(f"⚠️  No history rows. Wrote empty {OUTFILE}.")
         return
 
@@ -82,8 +84,9 @@ def main():
         "data": sorted(trends, key=lambda x: (-x["games"], x["referee"]))
     }
 
-    with open(OUTFILE, "w", encoding="utf-8") as f:
+    with open(OUTFILE + ".tmp", "w", encoding="utf-8") as f:
         json.dump(payload, f, indent=2, ensure_ascii=False)
+    os.replace(OUTFILE + ".tmp", OUTFILE)
 
     print(f"✅ Wrote {OUTFILE} with {len(trends)} referee trend rows")
 
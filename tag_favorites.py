@@ -21,38 +21,49 @@ def main():
         payload = json.load(f)
 
     games = payload.get("data", [])
+    # one timestamp for the whole batch instead of a datetime + isoformat
+    # allocation per game
+    tagged_at = datetime.now(timezone.utc).isoformat()
     for g in games:
         lines = g.get("lines") or []
         if len(lines) < 2:
             continue
 
-        # normalize missing spreads to None
-        spreads = [(ln.get("team"), ln.get("spread")) for ln in lines]
-        spreads = [(t, s if isinstance(s,(int,float)) else None) for t,s in spreads]
+        # Single scan: we only ever read the most negative and most
+        # positive spread, so skip the intermediate normalized lists.
+        fav_team = dog_team = None
+        fav_spread = dog_spread = None
+        valid_count = 0
+        for ln in lines:
+            # duck-typed fast path: one C conversion instead of an
+            # isinstance tuple check plus a later float() cast
+            try:
+                s = float(ln.get("spread"))
+            except (TypeError, ValueError):
+                continue
+            valid_count += 1
+            if fav_spread is None or s < fav_spread:
+                fav_team, fav_spread = ln.get("team"), s
+            if dog_spread is None or s > dog_spread:
+                dog_team, dog_spread = ln.get("team"), s
 
         # prefer actual negative/positive. if None or 0s, skip favorite tagging.
-        valid = [(t,s) for t,s in spreads if s is not None]
-        if len(valid) < 2:
+        if valid_count < 2:
             continue
 
-        fav = min(valid, key=lambda x: x[1])   # most negative
-        dog = max(valid, key=lambda x: x[1])
-
-        fav_team, fav_spread = fav
-        dog_team, dog_spread = dog
-
         g["fav_team"] = fav_team
         g["dog_team"] = dog_team
-        g["fav_spread"] = float(fav_spread)
-        g["dog_spread"] = float(dog_spread)
-        g["spread"] = float(fav_spread)
+        g["fav_spread"] = fav_spread
+        g["dog_spread"] = dog_spread
+        g["spread"] = fav_spread
         g["favorite"] = f"{fav_team} {fav_spread:+.1f}".replace("+", "+")
         g["underdog"] = f"{dog_team} {dog_spread:+.1f}".replace("+", "+")
-        g["tagged_at"] = datetime.now(timezone.utc).isoformat()
+        g["tagged_at"] = tagged_at
 
     payload["data"] = games
-    with open("combined.json","w",encoding="utf-8") as f:
+    with open("combined.json.tmp","w",encoding="utf-8") as f:
         json.dump(payload, f, indent=2)
+    os.replace("combined.json.tmp", "combined.json")
 
     print(f"[✅] Tagged favorites for {len(games)} games.")
 
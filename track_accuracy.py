@@ -27,6 +27,48 @@ def get(url):
     except:
         return None
 
+# one fetch per league event list / event ref per run, not per game
+_events_cache = {}
+_ref_cache = {}
+
+def get_league_events(league_path):
+    events = _events_cache.get(league_path)
+    if events is None:
+        events = get(f"https://sports.core.api.espn.com/v2/sports/{league_path}/events")
+        _events_cache[league_path] = events or {}
+    return _events_cache[league_path]
+
+def get_ref(ref):
+    data = _ref_cache.get(ref)
+    if data is None:
+        data = get(ref)
+        _ref_cache[ref] = data or {}
+    return _ref_cache[ref]
+
+# league_path -> ({frozenset(team names): event}, [(event name, event)]),
+# built once so matching a game is a dict lookup instead of rescanning
+# every event ref per game
+_match_index = {}
+
+def get_league_match_index(league_path):
+    built = _match_index.get(league_path)
+    if built is None:
+        idx, rows = {}, []
+        events = get_league_events(league_path)
+        for ev in (events.get("items") or []):
+            ref = ev.get("$ref")
+            if not ref:
+                continue
+            data = get_ref(ref)
+            if not data:
+                continue
+            rows.append((data.get("name", ""), data))
+            names = frozenset(get_score_map(data))
+            if names:
+                idx[names] = data
+        _match_index[league_path] = built = (idx, rows)
+    return built
+
 def parse_game_date(g):
     raw = g.get("date_local") or g.get("date_utc")
     if not raw:
@@ -88,25 +130,15 @@ def main():
         if not league_path:
             continue
 
-        # Pull ESPN event list
-        events = get(f"https://sports.core.api.espn.com/v2/sports/{league_path}/events")
-        if not events or "items" not in events:
-            continue
-
-        # Match game
-        event_json = None
-        for ev in events["items"]:
-            ref = ev.get("$ref")
-            if not ref:
-                continue
-            data = get(ref)
-            if not data:
-                continue
-
-            name = data.get("name", "")
-            if fav and fav in name and dog and dog in name:
-                event_json = data
-                break
+        # Match game: exact competitor-pair lookup first, substring scan
+        # over the prebuilt rows as the fallback
+        idx, rows = get_league_match_index(league_path)
+        event_json = idx.get(frozenset((fav, dog))) if fav and dog else None
+        if event_json is None and fav and dog:
+            for name, data in rows:
+                if fav in name and dog in name:
+                    event_json = data
+                    break
 
         if not event_json:
             continue
@@ -151,7 +183,8 @@ def main():
             "OU": round((v["OU"]["w"] / v["OU"]["t"] * 100), 2) if v["OU"]["t"] else 0,
         }
 
-    with open(OUTPUT, "w") as f:
+    with open(OUTPUT + ".tmp", "w") as f:
         json.dump(out, f, indent=2)
+    os.replace(OUTPUT + ".tmp", OUTPUT)
 
     print("✅ Wrote accuracy.json")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Shared helpers for the weather pipeline scripts.
+
+fetch_weather.py, weather_risk1.py and merge_weather.py each carried
+their own copies of load_json/save_json and the wind parser; one
+implementation here means one place to optimize and fix.
+"""
+
+import json
+import os
+
+try:
+    import orjson  # faster parse/serialize; stdlib json is the fallback
+except ImportError:
+    orjson = None
+
+
+def load_json(path):
+    # open directly and catch the miss: one syscall instead of an
+    # exists-then-open pair, and no TOCTOU window between them
+    try:
+        with open(path, "rb") as f:
+            buf = f.read()
+    except FileNotFoundError:
+        return None
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def save_json(path, obj):
+    # atomic: serialize to bytes, write a temp file, then os.replace
+    if orjson is not None:
+        buf = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        buf = json.dumps(obj, indent=2).encode("utf-8")
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(buf)
+    os.replace(tmp, path)
+
+
+def make_key(lat, lon):
+    """Rounded-coordinate cache key shared by the points/venue caches.
+
+    Two decimals (~1.1km) is well inside NWS's ~2.5km gridpoint
+    resolution, so neighboring venues bucket to one /points/ lookup
+    without changing which forecast they get.
+    """
+    return f"{float(lat):.2f},{float(lon):.2f}"
+
+
+def parse_wind_mph(raw_wind):
+    """NOAA windSpeed is often '10 mph'. Convert to numeric mph when possible.
+
+    Plain token scan for the first number in strings like "10 mph" or
+    "5 to 10 mph" — cheaper than spinning up the re engine per game.
+    """
+    if raw_wind is None:
+        return None
+    if isinstance(raw_wind, (int, float)):
+        return float(raw_wind)
+    if isinstance(raw_wind, str):
+        for tok in raw_wind.split():
+            if tok.replace(".", "", 1).isdigit():
+                return float(tok)
+    return None
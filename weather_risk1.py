@@ -9,24 +9,18 @@ Input:  weather_raw.json
 Output: weather.json
 """
 
-import json
-import os
 from datetime import datetime, timezone
 
+from weather_common import load_json, save_json
+
 RAW_FILE = "weather_raw.json"
 OUT_FILE = "weather.json"
 
-
-def load_json(path):
-    if not os.path.exists(path):
-        return None
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def save_json(path, obj):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2)
+# built once instead of per classify_risk call
+BAD_WORDS = (
+    "rain", "showers", "storm", "thunder", "snow",
+    "sleet", "freezing", "hail",
+)
 
 
 def classify_risk(temp_f, wind_mph, summary: str):
@@ -53,11 +47,7 @@ def classify_risk(temp_f, wind_mph, summary: str):
             risk += 1
 
     # Precipitation / storms
-    bad_words = [
-        "rain", "showers", "storm", "thunder", "snow",
-        "sleet", "freezing", "hail"
-    ]
-    if any(w in summary_l for w in bad_words):
+    if any(w in summary_l for w in BAD_WORDS):
         risk += 1
 
     if risk > 3: